@@ -8,10 +8,13 @@ from typing import Any
 
 import click
 
+# Only what the group needs before a subcommand is chosen. Everything heavier —
+# bmnews.config included — is imported inside the command that uses it, so
+# `bmnews --help` and `bmnews --version` pay for click and nothing else.
+# bmnews.constants stays at module level because DEFAULT_PAGE_SIZE is consumed
+# at decoration time, and the module imports nothing of its own.
 from bmnews import __version__
-from bmnews.config import load_config, write_default_config
 from bmnews.constants import CLI_TITLE_TRUNCATE, DEFAULT_PAGE_SIZE
-from bmnews.metadata import parse_transparency
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +81,8 @@ class _CleanFailureGroup(click.Group):
 @click.pass_context
 def main(ctx: click.Context, config_path: str | None, verbose: bool) -> None:
     """BioMedical News Reader — discover relevant preprints."""
+    from bmnews.config import load_config
+
     ctx.ensure_object(dict)
 
     # Handlers first, config second. `load_config` raises on a malformed TOML
@@ -272,6 +277,7 @@ def transparency(
     but does not by itself redo a paper that already has a determinate result —
     combine it with --refresh to force that.
     """
+    from bmnews.metadata import parse_transparency
     from bmnews.transparency import service
 
     config = ctx.obj["config"]
@@ -347,6 +353,7 @@ def transparency(
 @click.pass_context
 def init(ctx: click.Context, config_path: str | None) -> None:
     """Initialize database and create default config file."""
+    from bmnews.config import load_config, write_default_config
     from bmnews.db.schema import init_db, open_db
 
     # Create config
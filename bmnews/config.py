@@ -6,6 +6,8 @@ provides typed dataclass access to all configuration sections.
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import re
 import tomllib
@@ -225,6 +227,21 @@ _DEPRECATED_KEYS: dict[type, dict[str, str]] = {
 }
 
 
+@functools.cache
+def _section_keys(dc_type: type) -> frozenset[str]:
+    """The keys a section dataclass accepts, computed once per type.
+
+    Not just ``__dataclass_fields__``: the backward-compat source toggles
+    (``medrxiv = false``) and ``europepmc_query`` are *properties*, and an old
+    TOML file setting one must keep working. This is what ``hasattr`` probing
+    used to establish per key per load, minus the swallowed AttributeError.
+    """
+    keys = set(dc_type.__dataclass_fields__)
+    for klass in dc_type.__mro__:
+        keys.update(name for name, attr in vars(klass).items() if isinstance(attr, property))
+    return frozenset(keys)
+
+
 def _apply_section(dc: Any, data: dict) -> None:
     """Apply dict values onto a dataclass, ignoring unknown keys.
 
@@ -239,6 +256,7 @@ def _apply_section(dc: Any, data: dict) -> None:
         data: The raw TOML table for that section.
     """
     renames = _DEPRECATED_KEYS.get(type(dc), {})
+    accepted = _section_keys(type(dc))
     for key, value in data.items():
         if key in renames:
             new_key = renames[key]
@@ -258,7 +276,7 @@ def _apply_section(dc: Any, data: dict) -> None:
                 new_key,
             )
             key = new_key
-        if hasattr(dc, key):
+        if key in accepted:
             # Backward compat: old configs have research_interests as a list
             if key == "research_interests" and isinstance(value, list):
                 value = ", ".join(value)
@@ -268,17 +286,35 @@ def _apply_section(dc: Any, data: dict) -> None:
 def load_config(path: str | Path | None = None) -> AppConfig:
     """Load configuration from a TOML file.
 
-    Falls back to defaults if the file doesn't exist.
+    Falls back to defaults if the file doesn't exist. Parsing is cached on
+    ``(path, mtime, size)``, so the repeated loads a long-running GUI or a
+    multi-command pipeline run issues re-parse the file only when it has
+    actually changed. Callers get a deep copy each time — they mutate the
+    result (``bmnews fetch --days`` overwrites ``sources.lookback_days``), and
+    a shared instance would leak one call's overrides into the next.
     """
-    config = AppConfig()
-
     if path is None:
         path = DEFAULT_CONFIG_PATH
     path = Path(path).expanduser()
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         logger.info("Config file not found at %s — using defaults", path)
-        return config
+        return AppConfig()
+
+    return copy.deepcopy(_load_config_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse the TOML file at *path_str* into an :class:`AppConfig`.
+
+    ``mtime_ns`` and ``size`` take no part in the parse — they are cache-key
+    material, so an edited file misses the cache and is read afresh.
+    """
+    config = AppConfig()
+    path = Path(path_str)
 
     logger.info("Loading config from %s", path)
     with open(path, "rb") as f:
@@ -320,6 +356,7 @@ def write_default_config(path: str | Path | None = None) -> Path:
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(DEFAULT_CONFIG_TOML, encoding="utf-8")
+    _load_config_cached.cache_clear()
     logger.info("Created default config: %s", path)
     return path
 
@@ -453,6 +490,10 @@ def save_config(config: AppConfig, path: str | Path | None = None) -> Path:
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # The mtime in the cache key already misses on a rewritten file, but only
+    # at filesystem timestamp granularity — clear outright so a save inside
+    # that window cannot serve the pre-save parse.
+    _load_config_cached.cache_clear()
     return path
 
 
@@ -121,22 +121,29 @@ DEFAULT_PAGE_SIZE: int = 20
 SCORE_BADGE_HIGH: float = 0.7
 SCORE_BADGE_MID: float = 0.5
 
+#: Entries kept by ``format_abstract_html``'s memo. The formatter runs only
+#: when a paper is opened in the reading pane, so the memo's payoff is a
+#: paper being opened again later in the session; at a few KB per abstract
+#: this holds every abstract a reader could plausibly open while staying well
+#: under the size of one page of cached full text.
+ABSTRACT_FORMAT_CACHE_SIZE: int = 1024
+
 #: Fallback contact address sent to Europe PMC / Unpaywall when the user has
 #: not configured one (both APIs ask for an identifying email).
 DEFAULT_CONTACT_EMAIL: str = "bmnews@example.com"
 
+#: Entries kept by the GUI's full-text service memo. The key is the contact
+#: email, which in practice takes one value per run (the configured address or
+#: :data:`DEFAULT_CONTACT_EMAIL`); a small bound still evicts cleanly if the
+#: user edits theirs mid-session.
+FULLTEXT_SERVICE_CACHE_SIZE: int = 4
+
 #: Default desktop window geometry, used when no saved state exists.
 DEFAULT_WINDOW_WIDTH: int = 1200
 DEFAULT_WINDOW_HEIGHT: int = 800
 MIN_WINDOW_WIDTH: int = 600
 MIN_WINDOW_HEIGHT: int = 400
 
-#: Seconds to wait for the embedded Flask server to accept connections
-#: before opening the native window anyway.
-SERVER_START_TIMEOUT_SECONDS: float = 5.0
-
-#: Interval (seconds) between readiness probes while waiting for the server.
-SERVER_POLL_INTERVAL_SECONDS: float = 0.05
 
 #: Truncation length for paper titles printed by ``bmnews search``.
 CLI_TITLE_TRUNCATE: int = 80
@@ -823,6 +823,35 @@ def _m007_add_transparency(conn: Any) -> None:
     create_tables(conn, _M007_SQLITE if _is_sqlite(conn) else _M007_POSTGRESQL)
 
 
+# ---------------------------------------------------------------------------
+# Migration 8: indexes for the digest anti-join and the score ordering
+# ---------------------------------------------------------------------------
+
+# ``digest_papers`` is keyed ``(digest_id, paper_id)``, so the digest query's
+# "not already in a prior digest" anti-join probes the *second* column of that
+# primary key — which no btree can serve, leaving a scan of the whole link
+# table per run. Index the paper side directly; the notifications table
+# already got the equivalent (``idx_notifications_lookup``) at birth.
+#
+# The composite on ``scores`` replaces single-column ``idx_scores_combined``:
+# every query that orders on ``combined_score`` immediately joins or
+# anti-joins on the paper, so carrying ``paper_id`` in the index lets
+# PostgreSQL answer the top-N scan without heap fetches. The old index is a
+# leftmost prefix of the new one — keeping both would just cost a second
+# btree update on every score write — so it is dropped. Same SQL both
+# backends, like ``_M004_INDEXES``.
+_M008_INDEXES = """\
+CREATE INDEX IF NOT EXISTS idx_digest_papers_paper ON digest_papers (paper_id);
+CREATE INDEX IF NOT EXISTS idx_scores_combined_paper ON scores (combined_score DESC, paper_id);
+"""
+
+
+def _m008_add_query_indexes(conn: Any) -> None:
+    """Index the digest anti-join; widen and replace the combined-score index."""
+    create_tables(conn, _M008_INDEXES)
+    execute(conn, "DROP INDEX IF EXISTS idx_scores_combined")
+
+
 # ---------------------------------------------------------------------------
 # Migration registry
 # ---------------------------------------------------------------------------
@@ -835,4 +864,5 @@ MIGRATIONS: list[Migration] = [
     Migration(5, "add_notifications", _m005_add_notifications),
     Migration(6, "add_fulltext_pdf_url", _m006_add_fulltext_pdf_url),
     Migration(7, "add_transparency", _m007_add_transparency),
+    Migration(8, "add_query_indexes", _m008_add_query_indexes),
 ]
@@ -18,7 +18,7 @@ import logging
 from collections.abc import Sequence
 from typing import Any
 
-from bmlib.db import execute, fetch_all, fetch_one, fetch_scalar, is_sqlite, placeholder
+from bmlib.db import execute, fetch_all, fetch_one, fetch_scalar, is_sqlite
 from bmlib.db import transaction as _transaction
 from bmlib.fulltext.models import FullTextSourceEntry
 from bmlib.publications import store_publication
@@ -35,8 +35,30 @@ from bmnews.metadata import parse_metadata, parse_transparency
 
 logger = logging.getLogger(__name__)
 
-_is_sqlite = is_sqlite
-_placeholder = placeholder
+#: Backend flag per connection *class*. Every function here asks which
+#: backend it is talking to, often more than once per call; the answer is a
+#: property of the driver, not of the individual connection, so one probe per
+#: connection type answers it for the life of the process. Keyed on the type
+#: rather than stashed on the connection because sqlite3.Connection refuses
+#: arbitrary attributes.
+_BACKEND_IS_SQLITE: dict[type, bool] = {}
+
+
+def _is_sqlite(conn: Any) -> bool:
+    flag = _BACKEND_IS_SQLITE.get(type(conn))
+    if flag is None:
+        flag = is_sqlite(conn)
+        _BACKEND_IS_SQLITE[type(conn)] = flag
+    return flag
+
+
+def _placeholder(conn: Any) -> str:
+    return "?" if _is_sqlite(conn) else "%s"
+
+
+# Rows per multi-row INSERT. At two parameters a row this stays comfortably
+# under the 999-parameter limit older SQLite builds enforce.
+_INSERT_ROW_CHUNK = 400
 
 # Every paper query selects the same join, so the SELECT list and the FROM
 # clause live here rather than being retyped (and drifting) per query. The
@@ -211,12 +233,25 @@ def get_paper_with_score(conn: Any, paper_id: int) -> dict | None:
     return _row_to_paper(row) if row else None
 
 
+# What the scorer actually reads — deliberately not ``_PAPER_COLUMNS``, whose
+# ``p.*`` and extras join would materialise the GUI's cached full text for up
+# to UNSCORED_BATCH_SIZE papers per run, none of which scoring looks at.
+# ``doi`` is only for log lines; the transparency badge runs after scoring.
+_SCORING_PAPER_COLUMNS = """
+    p.id, p.doi, p.title, p.abstract, p.keywords, p.publication_types
+"""
+
+
 def get_unscored_papers(
     conn: Any,
     limit: int = UNSCORED_BATCH_SIZE,
 ) -> list[dict]:
     """Get papers that have no row in ``scores`` yet, newest first.
 
+    Selects only the columns the scorer reads (see
+    ``_SCORING_PAPER_COLUMNS``), so the batch stays cheap however much cached
+    full text the extras table has accumulated.
+
     Args:
         conn: DB-API connection.
         limit: Maximum number of papers to return. Callers that need to know
@@ -226,13 +261,15 @@ def get_unscored_papers(
         List of paper dicts, at most *limit* long.
     """
     ph = _placeholder(conn)
+    # NOT EXISTS rather than LEFT JOIN … IS NULL: each probe of scores'
+    # UNIQUE(paper_id) index can stop at its first hit, and nothing from the
+    # scores side has to be carried just to be tested for NULL.
     rows = fetch_all(
         conn,
         f"""
-        SELECT {_PAPER_COLUMNS}
-        {_PAPER_FROM}
-        LEFT JOIN scores s ON s.paper_id = p.id
-        WHERE s.id IS NULL
+        SELECT {_SCORING_PAPER_COLUMNS}
+        FROM publications p
+        WHERE NOT EXISTS (SELECT 1 FROM scores s WHERE s.paper_id = p.id)
         ORDER BY p.created_at DESC
         LIMIT {ph}
         """,
@@ -247,7 +284,7 @@ def count_unscored_papers(conn: Any) -> int:
         fetch_scalar(
             conn,
             "SELECT COUNT(*) FROM publications p "
-            "LEFT JOIN scores s ON s.paper_id = p.id WHERE s.id IS NULL",
+            "WHERE NOT EXISTS (SELECT 1 FROM scores s WHERE s.paper_id = p.id)",
         )
         or 0
     )
@@ -373,10 +410,9 @@ def get_papers_for_digest(
         SELECT {_PAPER_COLUMNS}, {_SCORE_COLUMNS}
         {_PAPER_FROM}
         JOIN scores s ON s.paper_id = p.id
-        LEFT JOIN digest_papers dp ON dp.paper_id = p.id
         WHERE s.combined_score >= {ph}
           AND s.relevance_score >= {ph}
-          AND dp.paper_id IS NULL
+          AND NOT EXISTS (SELECT 1 FROM digest_papers dp WHERE dp.paper_id = p.id)
           {tier_filter}
         ORDER BY s.combined_score DESC
         LIMIT {ph}
@@ -402,6 +438,18 @@ def _source_filter(conn: Any) -> str:
     )
 
 
+# What the list surfaces actually show — the GUI's paper cards (title, sources,
+# date, score badges) and `bmnews search` (doi, score, title). Every caller of
+# ``get_papers_filtered`` renders one of those, and none of them reads the
+# abstract, the authors or the extras blob, so a page of results must not haul
+# ``p.*`` plus the cached full text through the query. Opening a paper goes
+# through ``get_paper_with_score``, which still selects everything.
+_LIST_PAPER_COLUMNS = """
+    p.id, p.doi, p.title, p.publication_date, p.sources,
+    t.risk_level AS transparency_risk, t.transparency_score
+"""
+
+
 def get_papers_filtered(
     conn: Any,
     *,
@@ -447,6 +495,14 @@ def get_papers_filtered(
     if search:
         # SQLite's LIKE already ignores ASCII case; PostgreSQL's does not and
         # has ILIKE for exactly this, so the operator differs per backend.
+        #
+        # Deliberately *not* FTS5 / pg_trgm, despite the leading wildcard
+        # defeating any index: ``publications`` is bmlib's table, so shadow
+        # tables and triggers on it would break the next bmlib schema change;
+        # pg_trgm needs CREATE EXTENSION rights a hosted database may not
+        # grant; and the GUI searches as the user types, where tokenised
+        # matching would stop "covi" finding "COVID". A local corpus is a few
+        # thousand rows — revisit only if a scan here ever actually shows up.
         like = f"LIKE {ph}" if _is_sqlite(conn) else f"ILIKE {ph}"
         conditions.append(f"(p.title {like} OR p.abstract {like})")
         params.extend([f"%{search}%", f"%{search}%"])
@@ -463,8 +519,11 @@ def get_papers_filtered(
     }
     order_by = sort_map.get(sort, "s.combined_score DESC NULLS LAST")
 
+    # Not ``_PAPER_FROM``: nothing here selects from paper_extras, so the
+    # join would only make the planner carry the blob table for no output.
     base_query = f"""
-        {_PAPER_FROM}
+        FROM publications p
+        LEFT JOIN transparency t ON t.paper_id = p.id
         LEFT JOIN scores s ON s.paper_id = p.id
         {where}
     """
@@ -483,7 +542,7 @@ def get_papers_filtered(
     rows = fetch_all(
         conn,
         f"""
-        SELECT {_PAPER_COLUMNS}, {_SCORE_COLUMNS}
+        SELECT {_LIST_PAPER_COLUMNS}, {_SCORE_COLUMNS}
         {base_query}
         ORDER BY {order_by}
         LIMIT {ph} OFFSET {ph}
@@ -580,11 +639,20 @@ def record_digest(
             row = cur.fetchone()
             digest_id = row["id"] if isinstance(row, dict) else row[0]
 
-        for pid in paper_ids:
+        # One multi-row INSERT per chunk rather than one statement per paper:
+        # same single transaction, N fewer statement submissions. Chunked to
+        # stay under SQLite's historical 999-parameter floor at two
+        # parameters a row.
+        for start in range(0, len(paper_ids), _INSERT_ROW_CHUNK):
+            chunk = paper_ids[start : start + _INSERT_ROW_CHUNK]
+            values = ", ".join(f"({ph}, {ph})" for _ in chunk)
+            params: list[int] = []
+            for pid in chunk:
+                params.extend((digest_id, pid))
             execute(
                 conn,
-                f"INSERT INTO digest_papers (digest_id, paper_id) VALUES ({ph}, {ph})",
-                (digest_id, pid),
+                f"INSERT INTO digest_papers (digest_id, paper_id) VALUES {values}",
+                tuple(params),
             )
 
     return digest_id
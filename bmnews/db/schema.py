@@ -10,22 +10,61 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from bmlib.db import connect_postgresql, connect_sqlite, run_migrations
+from bmlib.db import (
+    connect_postgresql,
+    connect_sqlite,
+    execute,
+    fetch_all,
+    is_sqlite,
+    run_migrations,
+)
 
 from bmnews.db.migrations import MIGRATIONS
 
 logger = logging.getLogger(__name__)
 
+#: SQLite database files this process has already brought to the latest
+#: migration. One ``bmnews run`` opens a fresh connection per stage, and each
+#: stage calls :func:`init_db` because it is also individually CLI-invokable —
+#: so without this the migration table is re-read several times per run to
+#: learn nothing new. SQLite only, deliberately: the PostgreSQL test suite
+#: reuses one DSN across per-connection scratch schemas, so any key derived
+#: from the DSN would wrongly satisfy a database that has no tables yet, and
+#: one SELECT per stage is what a server round trip is for.
+_migrated_sqlite_files: set[str] = set()
+
 
 def init_db(conn: Any) -> None:
     """Create or migrate the database schema.
 
     Applies any pending migrations from ``MIGRATIONS``. Safe to call
-    repeatedly — already-applied migrations are skipped.
+    repeatedly — already-applied migrations are skipped, and a SQLite file
+    this process has already migrated is not even checked again.
     """
+    identity = _sqlite_file(conn)
+    if identity and identity in _migrated_sqlite_files:
+        return
+
     applied = run_migrations(conn, MIGRATIONS)
     if applied:
         logger.info("Database schema initialized (%d migration(s) applied)", applied)
+    if identity:
+        _migrated_sqlite_files.add(identity)
+
+
+def _sqlite_file(conn: Any) -> str:
+    """The file backing a SQLite connection's main database, or ``""``.
+
+    Returns ``""`` for PostgreSQL and for in-memory databases — the latter
+    report an empty file, which is exactly right: every ``:memory:`` handle is
+    a distinct database, so nothing may be memoized about them.
+    """
+    if not is_sqlite(conn):
+        return ""
+    for _seq, name, file in fetch_all(conn, "PRAGMA database_list"):
+        if name == "main":
+            return file or ""
+    return ""
 
 
 def open_db(config: Any) -> Any:
@@ -37,18 +76,48 @@ def open_db(config: Any) -> Any:
 
     db: DatabaseConfig = config.database if hasattr(config, "database") else config
 
-    if db.backend == "postgresql":
-        if db.pg_dsn:
-            conn = connect_postgresql(dsn=db.pg_dsn)
-        else:
-            conn = connect_postgresql(
-                host=db.pg_host,
-                port=db.pg_port,
-                database=db.pg_database,
-                user=db.pg_user,
-                password=db.pg_password,
-            )
-    else:
+    if db.backend != "postgresql":
         conn = connect_sqlite(db.sqlite_path)
+        _tune_sqlite(conn)
+        return conn
 
-    return conn
+    if db.pg_dsn:
+        return connect_postgresql(dsn=db.pg_dsn)
+    return connect_postgresql(
+        host=db.pg_host,
+        port=db.pg_port,
+        database=db.pg_database,
+        user=db.pg_user,
+        password=db.pg_password,
+    )
+
+
+#: Per-connection SQLite tuning. WAL lets the GUI keep reading while a
+#: pipeline run writes; with WAL on, synchronous=NORMAL defers the fsync to
+#: the checkpoint, which is the documented safe pairing — a crash can lose the
+#: last moments of a fetch, never corrupt the file, and a re-run re-fetches
+#: the day anyway. The rest keeps hot pages out of syscalls: a 64 MiB page
+#: cache (negative means KiB), temp structures in memory, and a 256 MiB mmap
+#: window. journal_mode persists in the file but is re-issued harmlessly;
+#: the others are per-connection and must be set on every open.
+#: busy_timeout matters precisely because WAL still allows only one writer:
+#: a digest run colliding with a GUI-triggered pipeline should wait out the
+#: other's commit, not fail with "database is locked".
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _tune_sqlite(conn: Any) -> None:
+    """Apply the SQLite tuning pragmas to a freshly opened connection.
+
+    Safe for in-memory databases: they simply report ``journal_mode=memory``
+    and ignore what does not apply to them.
+    """
+    for pragma in _SQLITE_PRAGMAS:
+        execute(conn, pragma)
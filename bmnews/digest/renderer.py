@@ -15,6 +15,7 @@ def render_digest(
     template_engine: TemplateEngine,
     subject_prefix: str = "[BioMedNews]",
     fmt: str = "html",
+    generated_at: str | None = None,
 ) -> str:
     """Render a digest from scored papers.
 
@@ -23,6 +24,10 @@ def render_digest(
         template_engine: Template engine instance.
         subject_prefix: Prefix for the digest header.
         fmt: Output format — "html" or "text".
+        generated_at: Timestamp string to stamp on the digest. Callers
+            rendering both formats of one digest should pass the same value,
+            so the HTML and plain-text halves of an email cannot disagree
+            about when they were generated. Defaults to now.
 
     Returns:
         Rendered digest string.
@@ -34,5 +39,5 @@ def render_digest(
         papers=papers,
         paper_count=len(papers),
         subject_prefix=subject_prefix,
-        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated_at=generated_at or datetime.now().strftime("%Y-%m-%d %H:%M"),
     )
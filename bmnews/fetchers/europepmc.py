@@ -65,18 +65,20 @@ def fetch_europepmc(
     total_fetched = 0
     records_total: int | None = None
 
+    # Only the cursor changes between pages; everything else is fixed for the
+    # whole day.
+    base_params = {
+        "query": date_query,
+        "format": "json",
+        "pageSize": EUROPEPMC_PAGE_SIZE,
+        "resultType": "core",
+    }
+
     try:
         for _page in range(MAX_FETCH_PAGES):
-            params = {
-                "query": date_query,
-                "format": "json",
-                "pageSize": EUROPEPMC_PAGE_SIZE,
-                "resultType": "core",
-                "cursorMark": cursor_mark,
-            }
             logger.debug("Fetching EuropePMC: %s", date_query)
 
-            response = client.get(SEARCH_URL, params=params)
+            response = client.get(SEARCH_URL, params={**base_params, "cursorMark": cursor_mark})
             response.raise_for_status()
             data = response.json()
 
@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from html import escape
 
-# Section heading tags used by PubMed/bioRxiv abstracts (e.g. <h4>Background</h4>)
-_HTML_HEADING_RE = re.compile(
-    r"<(h[1-6]|b|strong|i|em)>(.*?)</\1>",
-    re.IGNORECASE,
-)
+from bmnews.constants import ABSTRACT_FORMAT_CACHE_SIZE
 
 # Proper HTML tags for stripping (requires a letter after <, avoids matching "<5mg")
 _HTML_TAG_RE = re.compile(r"</?[a-zA-Z][a-zA-Z0-9]*\b[^>]*>")
@@ -26,6 +23,16 @@ _SECTION_PATTERN = re.compile(
     re.IGNORECASE | re.MULTILINE,
 )
 
+# A heading tag whose text is a known section label, matched in one pass
+# (e.g. <h4>Background</h4> in PubMed abstracts). Folding the label test into
+# the heading pattern means the regex engine walks the text once; a heading
+# that is *not* a section label needs no special handling, because the
+# generic tag strip below leaves its text behind anyway.
+_LABELED_HEADING_RE = re.compile(
+    rf"<(h[1-6]|b|strong|i|em)>\s*({_SECTION_LABELS})\s*</\1>",
+    re.IGNORECASE,
+)
+
 
 def _normalise_abstract(text: str) -> str:
     """Convert HTML-tagged abstracts into plain-text with section labels.
@@ -35,22 +42,20 @@ def _normalise_abstract(text: str) -> str:
     detect structured sections.  All remaining HTML tags are stripped and the
     text is then HTML-escaped for safe rendering.
     """
-
-    def _heading_to_label(m: re.Match) -> str:
-        """Turn a recognised heading tag into a plain ``Label:`` line."""
-        label = m.group(2).strip()
-        # Only convert if the heading text is a known section label
-        if re.match(rf"^({_SECTION_LABELS})$", label, re.IGNORECASE):
-            return f"\n{label}:"
-        return label
-
-    text = _HTML_HEADING_RE.sub(_heading_to_label, text)
-    text = _HTML_TAG_RE.sub("", text)
-    return text
+    text = _LABELED_HEADING_RE.sub(lambda m: f"\n{m.group(2)}:", text)
+    return _HTML_TAG_RE.sub("", text)
 
 
+@functools.lru_cache(maxsize=ABSTRACT_FORMAT_CACHE_SIZE)
 def format_abstract_html(text: str | None) -> str:
-    """Format abstract text as HTML with structured section labels bolded."""
+    """Format abstract text as HTML with structured section labels bolded.
+
+    Memoized: the reading pane re-runs the formatter every time a paper is
+    opened, the output depends on nothing but the text, and revisiting a
+    paper during a session is common — the second open skips the regex
+    pipeline. (The paper list shows no abstracts, so list scrolling never
+    reaches this.)
+    """
     if not text:
         return ""
 
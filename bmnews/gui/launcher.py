@@ -6,7 +6,6 @@ import json
 import logging
 import socket
 import threading
-import time
 from typing import Any
 
 from bmnews import __version__
@@ -16,8 +15,6 @@ from bmnews.constants import (
     DEFAULT_WINDOW_WIDTH,
     MIN_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH,
-    SERVER_POLL_INTERVAL_SECONDS,
-    SERVER_START_TIMEOUT_SECONDS,
 )
 from bmnews.db.schema import init_db, open_db
 
@@ -78,31 +75,32 @@ def _save_window_state(window: Any) -> None:
         logger.debug("Could not save window state")
 
 
-def _find_free_port() -> int:
-    """Find a free port on localhost."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
+def _bind_server_socket(port: int | None) -> socket.socket:
+    """Bind and listen on the server's socket before the server exists.
 
-
-def _wait_for_server(port: int, timeout: float) -> bool:
-    """Block until the local HTTP server accepts a connection.
+    Binding here rather than inside the server thread removes two guesses at
+    once: the old probe found a free port, closed it, and hoped it stayed free
+    until ``app.run()`` re-bound it, and the old readiness poll waited up to
+    five seconds to learn whether that had worked. A socket that is already
+    listening makes both questions moot — the port is provably ours, and a
+    connection made before ``serve_forever()`` starts simply queues in the
+    listen backlog until the server picks it up.
 
     Args:
-        port: Port the Flask server was told to listen on.
-        timeout: Maximum time to wait, in seconds.
+        port: Fixed port number, or None to let the OS choose one.
 
     Returns:
-        True if the server became reachable within *timeout*, else False.
+        A listening socket bound to 127.0.0.1; read the chosen port off
+        ``getsockname()``.
     """
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
-                return True
-        except OSError:
-            time.sleep(SERVER_POLL_INTERVAL_SECONDS)
-    return False
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Parity with the werkzeug server this replaced (allow_reuse_address = 1):
+    # without it, relaunching on a fixed --port right after closing the GUI
+    # can hit EADDRINUSE while old connections sit in TIME_WAIT.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", port or 0))
+    sock.listen(128)
+    return sock
 
 
 def _build_app(config: AppConfig) -> tuple[Any, Any]:
@@ -127,28 +125,24 @@ def launch(config: AppConfig, port: int | None = None) -> None:
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    if port is None:
-        port = _find_free_port()
+    sock = _bind_server_socket(port)
+    port = sock.getsockname()[1]
 
     app, conn = _build_app(config)
 
     def run_server() -> None:
-        """Serve the Flask app on the chosen port (blocks until shutdown)."""
-        app.run(host="127.0.0.1", port=port, use_reloader=False, threaded=True)
+        """Serve the Flask app on the already-bound socket (blocks until shutdown)."""
+        from werkzeug.serving import make_server
+
+        # fd= hands werkzeug the listening socket bound above, so the window
+        # can open without probing: the webview's first request waits in the
+        # backlog if it arrives before serve_forever() does.
+        server = make_server("127.0.0.1", port, app, threaded=True, fd=sock.fileno())
+        server.serve_forever()
 
     server_thread = threading.Thread(target=run_server, daemon=True)
     server_thread.start()
 
-    # Probe the socket rather than signalling before app.run(): setting an
-    # Event on the first line of the thread returns immediately and proves
-    # nothing about whether the server is actually listening yet.
-    if not _wait_for_server(port, SERVER_START_TIMEOUT_SECONDS):
-        logger.warning(
-            "Flask server not reachable on port %d after %.1fs — opening the window anyway",
-            port,
-            SERVER_START_TIMEOUT_SECONDS,
-        )
-
     # Open the native window with saved geometry
     geo = _load_window_state()
     kwargs: dict[str, Any] = {
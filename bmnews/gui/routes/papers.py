@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from urllib.parse import urlparse
 
@@ -9,7 +10,11 @@ from bmlib.fulltext import FullTextError, FullTextService
 from flask import Blueprint, abort, current_app, render_template, request
 from markupsafe import escape
 
-from bmnews.constants import DEFAULT_CONTACT_EMAIL, DEFAULT_PAGE_SIZE
+from bmnews.constants import (
+    DEFAULT_CONTACT_EMAIL,
+    DEFAULT_PAGE_SIZE,
+    FULLTEXT_SERVICE_CACHE_SIZE,
+)
 from bmnews.db.operations import (
     get_fulltext_sources,
     get_paper_with_score,
@@ -22,6 +27,19 @@ logger = logging.getLogger(__name__)
 papers_bp = Blueprint("papers", __name__)
 
 
+@functools.lru_cache(maxsize=FULLTEXT_SERVICE_CACHE_SIZE)
+def _fulltext_service(email: str) -> FullTextService:
+    """Return the full-text service for *email*, built once and reused.
+
+    The service owns the HTTP client whose pooled connections to Europe PMC
+    and Unpaywall stay open between retrievals; constructing one per click
+    would pay a fresh TLS handshake for every paper. Memoized on the contact
+    email because that is the constructor's only input — everything else
+    about a retrieval is passed to ``fetch_fulltext`` per call.
+    """
+    return FullTextService(email=email)
+
+
 @papers_bp.route("/papers")
 def paper_list() -> str:
     """Render the first page of the paper list, honouring sort and filters.
@@ -279,7 +297,7 @@ def paper_fulltext(paper_id: int) -> str:
     sources = get_fulltext_sources(conn, paper_id)
 
     email = current_app.config.get("BMNEWS_EMAIL") or DEFAULT_CONTACT_EMAIL
-    service = FullTextService(email=email)
+    service = _fulltext_service(email)
     try:
         result = service.fetch_fulltext(
             fulltext_sources=sources or None,
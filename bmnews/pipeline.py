@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from bmlib.db import transaction
 from bmlib.llm import LLMClient
 from bmlib.llm.providers import list_providers
 from bmlib.publications import source_names, sync
@@ -295,9 +296,13 @@ def run_score(
                 fields = dict(result)
                 paper_id = fields["paper_id"]
                 tags = fields.pop("matched_tags", [])
-                save_score(conn, **fields)
-                if tags:
-                    save_paper_tags(conn, paper_id=paper_id, tags=tags)
+                # One commit per paper, not one per table: bmlib's transaction
+                # is reentrant, so the score and its tags share a write — and a
+                # paper can never be visible scored but untagged.
+                with transaction(conn):
+                    save_score(conn, **fields)
+                    if tags:
+                        save_paper_tags(conn, paper_id=paper_id, tags=tags)
                 scored_count += 1
                 if on_scored:
                     on_scored(paper_id)
@@ -374,18 +379,22 @@ def run_digest(config: AppConfig, output: str | None = None) -> str:
 
         templates = build_template_engine(config)
 
-        # Render both formats
+        # Render both formats. One timestamp, taken once: the two renders are
+        # halves of the same digest and must not straddle a minute boundary.
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
         html_body = render_digest(
             papers,
             templates,
             subject_prefix=config.email.subject_prefix,
             fmt="html",
+            generated_at=generated_at,
         )
         text_body = render_digest(
             papers,
             templates,
             subject_prefix=config.email.subject_prefix,
             fmt="text",
+            generated_at=generated_at,
         )
 
         # Deliver
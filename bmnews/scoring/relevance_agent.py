@@ -7,6 +7,7 @@ and a concise summary.
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any
 
@@ -18,6 +19,17 @@ logger = logging.getLogger(__name__)
 class RelevanceAgent(BaseAgent):
     """Scores paper relevance against user research interests and generates summaries."""
 
+    @functools.cached_property
+    def _system_prompt(self) -> str:
+        """The system prompt, rendered once per agent.
+
+        It takes no variables, so rendering it inside :meth:`score` repeated
+        identical template work for every paper in a run. Cached on the
+        instance rather than the class so a user-dir template override picked
+        up by a new engine is honoured by the next run's agent.
+        """
+        return self.render_template("relevance_system.txt")
+
     def score(
         self,
         title: str,
@@ -42,11 +54,9 @@ class RelevanceAgent(BaseAgent):
             categories=categories,
         )
 
-        system_prompt = self.render_template("relevance_system.txt")
-
         try:
             result = self.chat_json(
-                [self.system_msg(system_prompt), self.user_msg(prompt)],
+                [self.system_msg(self._system_prompt), self.user_msg(prompt)],
             )
         except ValueError:
             logger.warning("Failed to score after retries: %s", title[:80])
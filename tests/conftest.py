@@ -59,6 +59,26 @@ def idle_jobs() -> Iterator[None]:
     _reset_jobs()
 
 
+@pytest.fixture(autouse=True)
+def fresh_fulltext_service() -> Iterator[None]:
+    """Clear the GUI's memoized ``FullTextService`` around every test.
+
+    The route tests patch ``bmnews.gui.routes.papers.FullTextService`` one
+    test at a time; without this, the memo would hand a later test the
+    instance an earlier test's patch built. Same import guard as
+    ``idle_jobs`` — the GUI extra may not be installed.
+    """
+    try:
+        from bmnews.gui.routes import papers
+    except ImportError:
+        yield
+        return
+
+    papers._fulltext_service.cache_clear()
+    yield
+    papers._fulltext_service.cache_clear()
+
+
 @pytest.fixture(params=backend_params())
 def db_backend(request: pytest.FixtureRequest) -> Iterator[str]:
     """Run the requesting test once per supported database backend.
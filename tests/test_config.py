@@ -64,6 +64,35 @@ research_interests = ["genomics", "CRISPR"]
         assert config.user.name == "Dr. Test"
         assert config.user.research_interests == "genomics, CRISPR"
 
+    def test_repeat_loads_are_cached_but_independent(self, tmp_path):
+        """A second load of an unchanged file skips the parse — but callers
+        mutate the result (``fetch --days`` does), so each load must hand back
+        its own copy, not the cached instance."""
+        cfg = tmp_path / "config.toml"
+        cfg.write_text("[sources]\nlookback_days = 14\n")
+
+        first = load_config(cfg)
+        first.sources.lookback_days = 1
+
+        second = load_config(cfg)
+        assert second.sources.lookback_days == 14
+
+    def test_editing_the_file_invalidates_the_cache(self, tmp_path):
+        cfg = tmp_path / "config.toml"
+        cfg.write_text("[sources]\nlookback_days = 14\n")
+        assert load_config(cfg).sources.lookback_days == 14
+
+        cfg.write_text("[sources]\nlookback_days = 3\n")
+        assert load_config(cfg).sources.lookback_days == 3
+
+    def test_save_config_invalidates_the_cache(self, tmp_path):
+        cfg = tmp_path / "config.toml"
+        loaded = load_config(save_config(AppConfig(), cfg))
+        loaded.sources.lookback_days = 21
+        save_config(loaded, cfg)
+
+        assert load_config(cfg).sources.lookback_days == 21
+
     def test_load_string_interests(self, tmp_path):
         cfg = tmp_path / "config.toml"
         cfg.write_text("""\
@@ -250,6 +279,18 @@ class TestSaveConfig:
         assert "[notifications.watches.melanoma-trials]" in text
 
 
+def test_section_keys_cover_properties_as_well_as_fields():
+    """The per-type key cache must keep accepting what hasattr used to: the
+    legacy per-source boolean toggles are properties, not dataclass fields."""
+    from bmnews.config import SourcesConfig, _section_keys
+
+    keys = _section_keys(SourcesConfig)
+    assert "enabled" in keys  # a real field
+    assert "medrxiv" in keys  # a backward-compat property
+    assert "europepmc_query" in keys
+    assert "no_such_key" not in keys
+
+
 def test_transparency_defaults():
     config = AppConfig()
     assert config.transparency.enabled is False
@@ -100,6 +100,62 @@ class TestSchema:
         assert table_exists(conn, "publications")
         assert table_exists(conn, "paper_tags")
 
+    def test_open_db_tunes_a_sqlite_file(self, tmp_path):
+        """WAL + synchronous=NORMAL is what lets the GUI read while a
+        pipeline run writes; both must be applied on every open."""
+        from contextlib import closing
+
+        from bmnews.config import DatabaseConfig
+        from bmnews.db.schema import open_db
+
+        cfg = DatabaseConfig(sqlite_path=str(tmp_path / "tuned.db"))
+        with closing(open_db(cfg)) as conn:
+            assert fetch_scalar(conn, "PRAGMA journal_mode") == "wal"
+            assert fetch_scalar(conn, "PRAGMA synchronous") == 1  # NORMAL
+
+    def test_a_migrated_sqlite_file_is_not_rechecked(self, tmp_path, monkeypatch):
+        """One pipeline run calls init_db once per stage; after the first the
+        migration table holds nothing new, so the rest must not re-read it."""
+        from bmlib.db import connect_sqlite
+
+        from bmnews.db import schema
+
+        monkeypatch.setattr(schema, "_migrated_sqlite_files", set())
+        conn = connect_sqlite(str(tmp_path / "memo.db"))
+        schema.init_db(conn)
+
+        checks: list = []
+        monkeypatch.setattr(schema, "run_migrations", lambda *a: checks.append(a) or 0)
+        schema.init_db(conn)
+        assert checks == []
+
+    def test_in_memory_databases_are_never_memoized(self, monkeypatch):
+        """Every :memory: handle is a distinct database — a memo hit for one
+        would leave the next test's database with no tables at all."""
+        from bmlib.db import connect_sqlite
+
+        from bmnews.db import schema
+
+        monkeypatch.setattr(schema, "_migrated_sqlite_files", set())
+        init_db(connect_sqlite(":memory:"))
+        assert schema._migrated_sqlite_files == set()
+
+    def test_backend_dispatch_probes_each_connection_type_once(self, monkeypatch):
+        """Which backend a connection belongs to is a property of its driver
+        class; one probe must answer for every later call on that backend."""
+        from bmnews.db import operations
+
+        monkeypatch.setattr(operations, "_BACKEND_IS_SQLITE", {})
+        probes: list = []
+        real = operations.is_sqlite
+        monkeypatch.setattr(operations, "is_sqlite", lambda c: probes.append(c) or real(c))
+
+        conn = _db()
+        ph = operations._placeholder(conn)
+        assert operations._placeholder(conn) == ph
+        assert operations._is_sqlite(conn) is operations._is_sqlite(conn)
+        assert len(probes) == 1
+
     def test_migrations_recorded(self):
         conn = _db()
         from bmlib.db.migrations import get_applied_versions
@@ -242,6 +298,22 @@ class TestScores:
         assert "10.1101/b" in dois
         assert "10.1101/c" not in dois
 
+    def test_unscored_papers_do_not_carry_the_fulltext_cache(self):
+        """The scoring batch must stay narrow however much full text the GUI
+        has cached — 500 papers times a cached article is real memory."""
+        conn = _db()
+        pid = store_paper(conn, doi="10.1101/ft", title="Cached", abstract="A")
+        save_fulltext(conn, paper_id=pid, html="<p>" + "x" * 10_000 + "</p>", source="europepmc")
+
+        papers = get_unscored_papers(conn)
+        assert len(papers) == 1
+        assert "fulltext_html" not in papers[0]
+        # What the scorer reads is still there.
+        assert papers[0]["title"] == "Cached"
+        assert papers[0]["abstract"] == "A"
+        assert papers[0]["keywords"] == []
+        assert papers[0]["publication_types"] == []
+
 
 class TestDigests:
     def test_papers_for_digest_excludes_sent(self):
@@ -454,6 +526,21 @@ class TestPapersFiltered:
         assert len(results) == 2
         assert total == 3
 
+    def test_list_pages_do_not_carry_the_fulltext_cache(self):
+        """Every caller renders paper cards or CLI lines; a page of results
+        must not haul the cached full text along for either."""
+        conn = _db()
+        p1, _, _ = self._seed(conn)
+        save_fulltext(conn, paper_id=p1, html="<p>" + "x" * 10_000 + "</p>", source="europepmc")
+
+        results = get_papers_filtered(conn)
+        assert all("fulltext_html" not in paper for paper in results)
+        assert all("authors" not in paper for paper in results)
+        # What the cards and `bmnews search` read is still there.
+        assert results[0]["title"]
+        assert results[0]["sources"]
+        assert results[0]["combined_score"] is not None
+
 
 class TestCachedDigestPapers:
     def test_returns_papers_from_previous_digests(self):
@@ -750,6 +837,27 @@ class TestRecordDigestId:
         assert first > 0
         assert second > first
 
+    def test_links_every_paper_across_the_insert_chunk_boundary(self):
+        """The multi-row INSERT is chunked; a digest larger than one chunk
+        must still link all of its papers."""
+        from bmnews.db.operations import _INSERT_ROW_CHUNK
+
+        conn = _db()
+        pids = [
+            store_paper(conn, doi=f"10.1101/bulk{i}", title=f"B{i}")
+            for i in range(_INSERT_ROW_CHUNK + 3)
+        ]
+
+        digest_id = record_digest(conn, pids, delivery_method="stdout")
+
+        ph = placeholder(conn)
+        linked = fetch_scalar(
+            conn,
+            f"SELECT COUNT(*) FROM digest_papers WHERE digest_id = {ph}",
+            (digest_id,),
+        )
+        assert linked == len(pids)
+
 
 class TestDigestSelectionFilters:
     """min_relevance and min_quality_tier must actually reach the SQL."""
@@ -1928,3 +2036,44 @@ class TestMigration7:
         init_db(conn)
         run_migrations(conn, MIGRATIONS)
         assert table_exists(conn, "transparency")
+
+
+def _index_exists(conn, name: str) -> bool:
+    """Whether an index named *name* exists, on either backend.
+
+    Scoped to the current schema on PostgreSQL — the test schemas share one
+    database, so an unscoped catalog query would see a neighbour's indexes.
+    """
+    from bmnews.db.operations import _is_sqlite
+
+    ph = placeholder(conn)
+    if _is_sqlite(conn):
+        sql = f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name = {ph}"
+    else:
+        sql = (
+            "SELECT COUNT(*) FROM pg_indexes "
+            f"WHERE schemaname = current_schema() AND indexname = {ph}"
+        )
+    return bool(fetch_scalar(conn, sql, (name,)))
+
+
+class TestMigration8:
+    def test_indexes_the_link_table_and_swaps_the_score_index(self):
+        conn = new_db()
+        run_migrations(conn, MIGRATIONS[:7])
+        assert _index_exists(conn, "idx_scores_combined")
+        assert not _index_exists(conn, "idx_digest_papers_paper")
+
+        run_migrations(conn, MIGRATIONS)
+
+        assert _index_exists(conn, "idx_digest_papers_paper")
+        assert _index_exists(conn, "idx_scores_combined_paper")
+        # Replaced, not duplicated: the old index is a leftmost prefix of the
+        # new one, so keeping it would only tax every score write.
+        assert not _index_exists(conn, "idx_scores_combined")
+
+    def test_is_idempotent(self):
+        conn = _db()
+        init_db(conn)
+        run_migrations(conn, MIGRATIONS)
+        assert _index_exists(conn, "idx_digest_papers_paper")
@@ -361,6 +361,20 @@ class TestFullTextRoute:
         resp = seeded_client.post("/papers/99999/fulltext")
         assert resp.status_code == 404
 
+    def test_service_is_built_once_across_requests(self, seeded_client):
+        conn = seeded_client.application.config["BMNEWS_DB"]
+        p1 = get_paper_by_doi(conn, "10.1101/g1")
+        p2 = get_paper_by_doi(conn, "10.1101/g2")
+        with patch("bmnews.gui.routes.papers.FullTextService") as mock_svc:
+            mock_svc.return_value.fetch_fulltext.return_value = FullTextResult(
+                source="europepmc",
+                html="<p>Full text content</p>",
+            )
+            seeded_client.post(f"/papers/{p1['id']}/fulltext")
+            seeded_client.post(f"/papers/{p2['id']}/fulltext")
+            assert mock_svc.call_count == 1
+            assert mock_svc.return_value.fetch_fulltext.call_count == 2
+
 
 class TestFullTextPDFLink:
     """The PDF stays on offer beside text extracted from it.
@@ -509,11 +523,21 @@ class TestFullTextLinkSafety:
 
 
 class TestLauncher:
-    def test_find_free_port(self):
-        from bmnews.gui.launcher import _find_free_port
-
-        port = _find_free_port()
-        assert 1024 < port < 65536
+    def test_bind_server_socket_is_listening_before_any_server_runs(self):
+        import socket
+
+        from bmnews.gui.launcher import _bind_server_socket
+
+        sock = _bind_server_socket(None)
+        try:
+            port = sock.getsockname()[1]
+            assert 1024 < port < 65536
+            # The point of binding up front: a connection made before the
+            # server thread exists queues in the backlog instead of failing.
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                pass
+        finally:
+            sock.close()
 
     def test_build_app(self, tmp_path):
         from bmnews.gui.launcher import _build_app
@@ -56,3 +56,13 @@ class TestFormatAbstractHTML:
         assert "<strong>Background:</strong>" in html
         assert "in vitro" in html
         assert "<i>" not in html
+
+    def test_repeat_renders_are_served_from_the_memo(self):
+        """Re-opening a paper re-renders its abstract in the reading pane; the
+        second render of a given text must not re-run the regex pipeline."""
+        format_abstract_html.cache_clear()
+        text = "Background: Same paper, rendered twice."
+        first = format_abstract_html(text)
+        hits_before = format_abstract_html.cache_info().hits
+        assert format_abstract_html(text) == first
+        assert format_abstract_html.cache_info().hits == hits_before + 1
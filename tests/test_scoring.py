@@ -149,6 +149,16 @@ class TestRelevanceScoreClamping:
         assert result["matched_tags"] == []
         assert result["key_findings"] == []
 
+    def test_system_prompt_renders_once_across_papers(self):
+        """relevance_system.txt takes no variables, so a 500-paper run must
+        not render it 500 times."""
+        agent = self._agent({"relevance_score": 0.5})
+        agent.score("T1", "A1", "I")
+        agent.score("T2", "A2", "I")
+
+        rendered = [c.args[0] for c in agent.render_template.call_args_list]
+        assert rendered.count("relevance_system.txt") == 1
+
     def test_valid_response_passes_through(self):
         result = self._agent(
             {